@@ -0,0 +1,84 @@
+"""
+_winicon.py
+
+Shared Win32 helpers for the controller and the fullscreen child.
+
+- `user32` / `shell32`: the DLLs bound once, with explicit prototypes so handles and
+  LPARAMs are marshalled as pointer-sized values on 64-bit Python. Import these
+  rather than creating another WinDLL.
+- `toplevel()`: map a Tk `winfo_id()` to the wrapper window Windows actually decorates.
+- `apply()` / `destroy()`: set a window's taskbar/titlebar icon from an .ico file with
+  a single LoadImageW, and release it again.
+"""
+from __future__ import annotations
+
+import ctypes
+import sys
+from ctypes import wintypes
+from pathlib import Path
+
+LR_LOADFROMFILE = 0x00000010
+IMAGE_ICON = 1
+WM_SETICON = 0x0080
+ICON_SMALL = 0
+ICON_BIG = 1
+
+if sys.platform == 'win32':
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    shell32 = ctypes.WinDLL("shell32")
+
+    user32.LoadImageW.argtypes = [wintypes.HINSTANCE, wintypes.LPCWSTR, wintypes.UINT, ctypes.c_int, ctypes.c_int, wintypes.UINT]
+    user32.LoadImageW.restype = wintypes.HANDLE
+    user32.SendMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+    user32.SendMessageW.restype = wintypes.LPARAM
+    user32.DestroyIcon.argtypes = [wintypes.HICON]
+    user32.DestroyIcon.restype = wintypes.BOOL
+    # The new value is an HICON here; a handle type lets a NULL (None) icon through
+    if hasattr(user32, 'SetClassLongPtrW'):
+        user32.SetClassLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.HANDLE]
+        user32.SetClassLongPtrW.restype = ctypes.c_size_t
+    user32.SetClassLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.HANDLE]
+    user32.SetClassLongW.restype = wintypes.DWORD
+    user32.GetSystemMetrics.argtypes = [ctypes.c_int]
+    user32.GetSystemMetrics.restype = ctypes.c_int
+    user32.GetParent.argtypes = [wintypes.HWND]
+    user32.GetParent.restype = wintypes.HWND
+    user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+    user32.GetAncestor.restype = wintypes.HWND
+    user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT]
+    user32.SetWindowPos.restype = wintypes.BOOL
+
+    shell32.SetCurrentProcessExplicitAppUserModelID.argtypes = [wintypes.LPCWSTR]
+    shell32.SetCurrentProcessExplicitAppUserModelID.restype = ctypes.HRESULT
+    shell32.ExtractIconExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.HICON), ctypes.POINTER(wintypes.HICON), wintypes.UINT]
+    shell32.ExtractIconExW.restype = wintypes.UINT
+
+
+def toplevel(hwnd: int) -> int:
+    """Return the top-level window that contains `hwnd`.
+    On Windows, Tk's winfo_id() is a child of a wrapper frame; WM_SETICON, class icons
+    and SetWindowPos only have an effect on that wrapper. Needs the window to be mapped
+    (e.g. after update_idletasks()). A top-level hwnd is returned unchanged.
+    """
+    GA_ROOT = 2
+    return user32.GetAncestor(hwnd, GA_ROOT) or hwnd
+
+
+def apply(hwnd: int, ico_path: str | Path) -> int:
+    """Load `ico_path` and send it as both the small and big icon of the top-level
+    window containing `hwnd`.
+    Returns the HICON (owned by the caller, free it with destroy()), or 0 on failure.
+    """
+    hwnd = toplevel(hwnd)
+    hicon = user32.LoadImageW(None, str(ico_path), IMAGE_ICON, 0, 0, LR_LOADFROMFILE)
+    if not hicon:
+        return 0
+    user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, hicon)
+    user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, hicon)
+    return hicon
+
+
+def destroy(hicon: int) -> None:
+    """Release an HICON returned by apply(). No-op for 0."""
+    if hicon:
+        user32.DestroyIcon(hicon)
@@ -8,18 +8,45 @@ Usage:
 - The controller starts a child process which runs the fullscreen black window.
 
 When packaged with PyInstaller as a single exe, the controller exe can spawn itself with
-the `--child <index>` argument to show the fullscreen black window.
+the `--child` argument to show the fullscreen black window. The monitor index is passed
+in the `BC_MON_IDX` environment variable.
 """
 from __future__ import annotations
 
+import os
 import sys
+
+
+def run_child_mode_from_args():
+    """If called with --child, import the fullscreen module and run it on the monitor
+    given by the BC_MON_IDX environment variable (default 1).
+    This allows the bundled exe to spawn itself in child mode.
+    """
+    import fullscreen_black
+
+    try:
+        idx = int(os.environ.get("BC_MON_IDX", "1"))
+    except ValueError:
+        print("Invalid monitor index; falling back to 1.")
+        idx = 1
+
+    fullscreen_black.cover_monitor(idx)
+
+
+# Child mode is dispatched before the controller's own imports (tkinter, Win32
+# bindings, AppUserModelID) so the spawned child only loads what fullscreen_black needs.
+if __name__ == "__main__" and "--child" in sys.argv:
+    run_child_mode_from_args()
+    sys.exit(0)
+
 import subprocess
 import threading
-import time
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk
 
+import _winicon
+
 # Windows-specific: use Job Object to ensure child processes are killed when parent exits
 try:
     import ctypes
@@ -28,25 +55,62 @@ try:
 except Exception:
     _have_job = False
 
+if sys.platform == 'win32':
+    # user32/shell32 are bound once in _winicon; kernel32/ntdll are only used here.
+    # Explicit prototypes keep handles pointer-sized on 64-bit Python.
+    from _winicon import user32 as _user32, shell32 as _shell32
+    _kernel32 = ctypes.WinDLL("kernel32")
+    _ntdll = ctypes.WinDLL("ntdll")
+
+    _kernel32.CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+    _kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    _kernel32.SetInformationJobObject.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    _kernel32.SetInformationJobObject.restype = wintypes.BOOL
+    _kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+    _kernel32.AssignProcessToJobObject.restype = wintypes.BOOL
+    _kernel32.TerminateJobObject.argtypes = [wintypes.HANDLE, wintypes.UINT]
+    _kernel32.TerminateJobObject.restype = wintypes.BOOL
+    _kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+    _ntdll.NtResumeProcess.argtypes = [wintypes.HANDLE]
+    _ntdll.NtResumeProcess.restype = ctypes.c_long
+
 # If running as a frozen exe, set the AppUserModelID as early as possible so
 # Windows associates windows created later with the correct AppID.
 if sys.platform == 'win32' and getattr(sys, 'frozen', False):
     try:
         exe_stem = Path(sys.executable).stem
         _early_appid = f"com.{exe_stem}"
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(_early_appid)
+        _shell32.SetCurrentProcessExplicitAppUserModelID(_early_appid)
     except Exception:
         pass
 
 
+# Results of the one-time AppUserModelID / window icon setup (see the setters below)
+_APPID_CACHE: tuple[str | None, bool] | None = None
+_ICON_CACHE: dict | None = None
+_ICON_HANDLES: list[int] = []
+
+
 def is_frozen() -> bool:
     return getattr(sys, "frozen", False)
 
 
-def set_app_user_model_id(appid: str | None = None) -> None:
+def set_app_user_model_id(appid: str | None = None) -> tuple[str | None, bool]:
     """Set the Windows Application User Model ID so the taskbar uses the exe icon.
+    Only the first call does any work; later calls return the cached (appid, ok).
     No-op on non-Windows.
     """
+    global _APPID_CACHE
+    if _APPID_CACHE is None:
+        _APPID_CACHE = _set_app_user_model_id(appid)
+    return _APPID_CACHE
+
+
+def _set_app_user_model_id(appid: str | None) -> tuple[str | None, bool]:
     if sys.platform != "win32":
         return (None, False)
     try:
@@ -59,92 +123,139 @@ def set_app_user_model_id(appid: str | None = None) -> None:
             else:
                 appid = "com.blackcontroller.dev"
         # Use wide char version
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(appid)
+        _shell32.SetCurrentProcessExplicitAppUserModelID(appid)
         return (appid, True)
     except Exception:
         # best-effort
         return (appid if appid else None, False)
 
 
-def set_window_icon_for_tk(root: tk.Tk) -> None:
+def set_window_icon_for_tk(root: tk.Tk) -> dict:
     """Force the window's icon (both big and small) using Win32 APIs so the taskbar shows it.
+    Only the first call does any work; later calls return the cached status dict.
     No-op on non-Windows or if icon.ico is missing.
     """
+    global _ICON_CACHE, _ICON_HANDLES
+    if _ICON_CACHE is None:
+        _ICON_CACHE, _ICON_HANDLES = _set_window_icon_for_tk(root)
+    return _ICON_CACHE
+
+
+def _set_window_icon_for_tk(root: tk.Tk) -> tuple[dict, list[int]]:
+    """Returns the status dict and the HICONs that were loaded (owned by the caller)."""
     if sys.platform != 'win32':
-        return {"used_icon_file": False, "extracted_exe_icon": False, "sent": False}
+        return {"used_icon_file": False, "extracted_exe_icon": False, "sent": False}, []
     try:
         ico = Path(__file__).with_name('icon.ico')
-        hwnd = root.winfo_id()
-        user32 = ctypes.windll.user32
-        LR_LOADFROMFILE = 0x00000010
-        IMAGE_ICON = 1
+        # Map the window first so Tk has created the top-level wrapper we set icons on
+        root.update_idletasks()
+        hwnd = _winicon.toplevel(root.winfo_id())
 
         # Try loading icon.ico first
         if ico.exists():
-            hicon = user32.LoadImageW(None, str(ico), IMAGE_ICON, 0, 0, LR_LOADFROMFILE)
+            hicon = _winicon.apply(hwnd, ico)
             if hicon:
-                WM_SETICON = 0x0080
-                ICON_SMALL = 0
-                ICON_BIG = 1
-                user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, hicon)
-                user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, hicon)
-                return {"used_icon_file": True, "extracted_exe_icon": False, "sent": True}
+                return {"used_icon_file": True, "extracted_exe_icon": False, "sent": True}, [hicon]
 
         # If icon.ico not present, and we're running frozen, try to extract icon from the exe
         if is_frozen():
-            phicon_large = ctypes.c_void_p()
-            phicon_small = ctypes.c_void_p()
-            res = ctypes.windll.shell32.ExtractIconExW(str(sys.executable), 0, ctypes.byref(phicon_large), ctypes.byref(phicon_small), 1)
+            phicon_large = wintypes.HICON()
+            phicon_small = wintypes.HICON()
+            res = _shell32.ExtractIconExW(str(sys.executable), 0, ctypes.byref(phicon_large), ctypes.byref(phicon_small), 1)
             if res > 0:
                 WM_SETICON = 0x0080
                 ICON_SMALL = 0
                 ICON_BIG = 1
                 sent = False
                 if phicon_small.value:
-                    user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, phicon_small.value)
+                    _user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, phicon_small.value)
                     sent = True
                 if phicon_large.value:
-                    user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, phicon_large.value)
+                    _user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, phicon_large.value)
                     sent = True
                 # Also set the window class icon (both big and small) which helps on some Windows versions
                 try:
                     GCLP_HICON = -14
                     GCLP_HICONSM = -34
                     # SetClassLongPtrW requires HWND and the index; use SetClassLongPtrW if available
-                    if hasattr(ctypes.windll.user32, 'SetClassLongPtrW'):
-                        ctypes.windll.user32.SetClassLongPtrW(hwnd, GCLP_HICON, phicon_large.value)
-                        ctypes.windll.user32.SetClassLongPtrW(hwnd, GCLP_HICONSM, phicon_small.value if phicon_small.value else phicon_large.value)
+                    if hasattr(_user32, 'SetClassLongPtrW'):
+                        _user32.SetClassLongPtrW(hwnd, GCLP_HICON, phicon_large.value)
+                        _user32.SetClassLongPtrW(hwnd, GCLP_HICONSM, phicon_small.value if phicon_small.value else phicon_large.value)
                     else:
                         # Fallback for older Python/Win32: SetClassLongW
-                        ctypes.windll.user32.SetClassLongW(hwnd, GCLP_HICON, phicon_large.value)
-                        ctypes.windll.user32.SetClassLongW(hwnd, GCLP_HICONSM, phicon_small.value if phicon_small.value else phicon_large.value)
+                        _user32.SetClassLongW(hwnd, GCLP_HICON, phicon_large.value)
+                        _user32.SetClassLongW(hwnd, GCLP_HICONSM, phicon_small.value if phicon_small.value else phicon_large.value)
                 except Exception:
                     pass
-                return {"used_icon_file": False, "extracted_exe_icon": True, "sent": sent}
+                hicons = [h for h in (phicon_large.value, phicon_small.value) if h]
+                return {"used_icon_file": False, "extracted_exe_icon": True, "sent": sent}, hicons
 
-        return {"used_icon_file": False, "extracted_exe_icon": False, "sent": False}
+        return {"used_icon_file": False, "extracted_exe_icon": False, "sent": False}, []
     except Exception:
         # best-effort
-        return {"used_icon_file": False, "extracted_exe_icon": False, "sent": False}
+        return {"used_icon_file": False, "extracted_exe_icon": False, "sent": False}, []
 
 
-def run_child_mode_from_args():
-    """If called with --child <index>, import the fullscreen module and run it.
-    This allows the bundled exe to spawn itself in child mode.
+def create_kill_on_close_job():
+    """Create a Job Object that kills every process in it when its last handle closes.
+    Returns the job handle, or None if it could not be configured. Windows only.
     """
-    import fullscreen_black
-
-    # default index is 1
-    idx = 1
+    # Define required structures
+    class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("PerProcessUserTimeLimit", ctypes.c_int64),
+            ("PerJobUserTimeLimit", ctypes.c_int64),
+            ("LimitFlags", wintypes.DWORD),
+            ("MinimumWorkingSetSize", ctypes.c_size_t),
+            ("MaximumWorkingSetSize", ctypes.c_size_t),
+            ("ActiveProcessLimit", wintypes.DWORD),
+            ("Affinity", ctypes.c_size_t),
+            ("PriorityClass", wintypes.DWORD),
+            ("SchedulingClass", wintypes.DWORD),
+        ]
+
+    class IO_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("ReadOperationCount", ctypes.c_uint64),
+            ("WriteOperationCount", ctypes.c_uint64),
+            ("OtherOperationCount", ctypes.c_uint64),
+            ("ReadTransferCount", ctypes.c_uint64),
+            ("WriteTransferCount", ctypes.c_uint64),
+            ("OtherTransferCount", ctypes.c_uint64),
+        ]
+
+    class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [
+            ("BasicLimitInformation", JOBOBJECT_BASIC_LIMIT_INFORMATION),
+            ("IoInfo", IO_COUNTERS),
+            ("ProcessMemoryLimit", ctypes.c_size_t),
+            ("JobMemoryLimit", ctypes.c_size_t),
+            ("PeakProcessMemoryUsed", ctypes.c_size_t),
+            ("PeakJobMemoryUsed", ctypes.c_size_t),
+        ]
+
+    JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x00002000
+    JobObjectExtendedLimitInformation = 9
+
+    hJob = _kernel32.CreateJobObjectW(None, None)
+    if not hJob:
+        return None
+    info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+    info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+    res = _kernel32.SetInformationJobObject(hJob, JobObjectExtendedLimitInformation, ctypes.byref(info), ctypes.sizeof(info))
+    if not res:
+        # couldn't set info, close job
+        _kernel32.CloseHandle(hJob)
+        return None
+    return hJob
+
+
+def _tk_is_threaded(root: tk.Tk) -> bool:
+    """Return True if the Tcl interpreter was built with thread support."""
     try:
-        i = sys.argv.index("--child")
-        if i + 1 < len(sys.argv):
-            idx = int(sys.argv[i + 1])
-    except ValueError:
-        print("Invalid monitor index; falling back to 1.")
-        pass
-
-    fullscreen_black.cover_monitor(idx)
+        return bool(root.tk.eval('set tcl_platform(threaded)'))
+    except Exception:
+        return False
 
 
 class ControllerApp:
@@ -159,6 +270,7 @@ class ControllerApp:
         except Exception:
             pass
         root.geometry("320x140")
+        root.protocol("WM_DELETE_WINDOW", self.quit)
 
         frm = ttk.Frame(root, padding=12)
         frm.pack(fill=tk.BOTH, expand=True)
@@ -181,9 +293,8 @@ class ControllerApp:
         self.quit_btn.grid(column=0, row=4, columnspan=2, pady=(8, 0), sticky=tk.EW)
 
         # Diagnostics area
-        self.diag_text = tk.Text(frm, height=6, width=36, wrap=tk.WORD)
-        self.diag_text.grid(column=0, row=5, columnspan=2, pady=(8,0))
-        self.diag_text.configure(state=tk.DISABLED)
+        self.diag_var = tk.StringVar()
+        ttk.Label(frm, textvariable=self.diag_var, justify=tk.LEFT, anchor="w").grid(column=0, row=5, columnspan=2, pady=(8,0), sticky=tk.EW)
 
         for child in frm.winfo_children():
             child.grid_configure(padx=4, pady=4)
@@ -191,142 +302,173 @@ class ControllerApp:
         self.proc = None
         self._polling = False
         self._job = None
+        # The waiter thread posts this event when the child exits
+        root.bind("<<ChildExited>>", self._on_child_exited)
         # Initial diagnostics
         self.refresh_diagnostics()
 
     def refresh_diagnostics(self):
-        # Show AppUserModelID and icon status
-        self.diag_text.configure(state=tk.NORMAL)
-        self.diag_text.delete('1.0', tk.END)
+        # Show AppUserModelID and icon status; both setters return their cached
+        # results here, so this never calls into user32/shell32 again
         appid, ok = set_app_user_model_id()
-        self.diag_text.insert(tk.END, f"AppUserModelID: {appid}\n")
-        self.diag_text.insert(tk.END, f"AppUserModelID set: {ok}\n")
         icon_status = set_window_icon_for_tk(self.root)
-        self.diag_text.insert(tk.END, f"Icon file used: {icon_status.get('used_icon_file')}\n")
-        self.diag_text.insert(tk.END, f"Extracted exe icon: {icon_status.get('extracted_exe_icon')}\n")
-        self.diag_text.insert(tk.END, f"WM_SETICON sent: {icon_status.get('sent')}\n")
-        self.diag_text.configure(state=tk.DISABLED)
-
-    def _get_child_command(self, index: int) -> list[str]:
-        # If running as a bundled exe, spawn the exe with --child
+        self.diag_var.set("\n".join([
+            f"AppUserModelID: {appid}",
+            f"AppUserModelID set: {ok}",
+            f"Icon file used: {icon_status.get('used_icon_file')}",
+            f"Extracted exe icon: {icon_status.get('extracted_exe_icon')}",
+            f"WM_SETICON sent: {icon_status.get('sent')}",
+        ]))
+
+    def _get_child_command(self, index: int) -> tuple[list[str], dict | None]:
+        # If running as a bundled exe, spawn the exe with --child; the monitor index
+        # travels in the environment so the child does not parse argv
         if is_frozen():
             exe = sys.executable
-            return [exe, "--child", str(index)]
+            env = os.environ.copy()
+            env["BC_MON_IDX"] = str(index)
+            return [exe, "--child"], env
         # Otherwise run the fullscreen_black.py with the current python executable
         script = Path(__file__).with_name("fullscreen_black.py")
-        return [sys.executable, str(script), str(index)]
+        return [sys.executable, str(script), str(index)], None
 
     def open_black(self):
         if self.proc is not None:
             return
         index = int(self.monitor_var.get())
-        cmd = self._get_child_command(index)
+        cmd, env = self._get_child_command(index)
+
+        # On Windows, create the Job Object before the child exists so it can be
+        # assigned while still suspended; nothing it spawns can escape the job.
+        job = None
+        if _have_job and sys.platform == 'win32':
+            try:
+                job = create_kill_on_close_job()
+            except Exception:
+                print("Failed to create job object")
+                job = None
 
         # Start the child process
         try:
-            # On Windows, avoid creating a new console window when possible
             creationflags = 0
-            self.proc = subprocess.Popen(cmd, creationflags=creationflags)
-            # If on Windows, create a Job Object and assign the child to it so the OS
-            # will terminate the child when this process exits.
-            if _have_job and sys.platform == 'win32':
-                try:
-                    kernel32 = ctypes.windll.kernel32
-
-                    # Define required structures
-                    class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
-                        _fields_ = [
-                            ("PerProcessUserTimeLimit", ctypes.c_int64),
-                            ("PerJobUserTimeLimit", ctypes.c_int64),
-                            ("LimitFlags", wintypes.DWORD),
-                            ("MinimumWorkingSetSize", ctypes.c_size_t),
-                            ("MaximumWorkingSetSize", ctypes.c_size_t),
-                            ("ActiveProcessLimit", wintypes.DWORD),
-                            ("Affinity", ctypes.c_size_t),
-                            ("PriorityClass", wintypes.DWORD),
-                            ("SchedulingClass", wintypes.DWORD),
-                        ]
-
-                    class IO_COUNTERS(ctypes.Structure):
-                        _fields_ = [
-                            ("ReadOperationCount", ctypes.c_uint64),
-                            ("WriteOperationCount", ctypes.c_uint64),
-                            ("OtherOperationCount", ctypes.c_uint64),
-                            ("ReadTransferCount", ctypes.c_uint64),
-                            ("WriteTransferCount", ctypes.c_uint64),
-                            ("OtherTransferCount", ctypes.c_uint64),
-                        ]
-
-                    class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
-                        _fields_ = [
-                            ("BasicLimitInformation", JOBOBJECT_BASIC_LIMIT_INFORMATION),
-                            ("IoInfo", IO_COUNTERS),
-                            ("ProcessMemoryLimit", ctypes.c_size_t),
-                            ("JobMemoryLimit", ctypes.c_size_t),
-                            ("PeakProcessMemoryUsed", ctypes.c_size_t),
-                            ("PeakJobMemoryUsed", ctypes.c_size_t),
-                        ]
-
-                    JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x00002000
-                    JobObjectExtendedLimitInformation = 9
-
-                    hJob = kernel32.CreateJobObjectW(None, None)
-                    if hJob:
-                        info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
-                        info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
-                        res = kernel32.SetInformationJobObject(hJob, JobObjectExtendedLimitInformation, ctypes.byref(info), ctypes.sizeof(info))
-                        if res:
-                            # Open process handle and assign it to the job
-                            PROCESS_ALL_ACCESS = 0x1F0FFF
-                            hProcess = kernel32.OpenProcess(PROCESS_ALL_ACCESS, False, self.proc.pid)
-                            if hProcess:
-                                ok = kernel32.AssignProcessToJobObject(hJob, hProcess)
-                                if ok:
-                                    # keep job handle alive on self so it closes when this process exits
-                                    self._job = hJob
-                                else:
-                                    kernel32.CloseHandle(hJob)
-                        else:
-                            # couldn't set info, close job
-                            kernel32.CloseHandle(hJob)
-                except Exception:
-                    print("Failed to set job object")
-                    # Best-effort; if Job API calls fail, continue without it
-                    pass
+            if sys.platform == 'win32':
+                CREATE_SUSPENDED = 0x00000004
+                CREATE_NO_WINDOW = 0x08000000
+                creationflags = CREATE_NO_WINDOW
+                if job:
+                    creationflags |= CREATE_SUSPENDED
+            self.proc = subprocess.Popen(cmd, env=env, creationflags=creationflags)
         except Exception as e:
+            if job:
+                _kernel32.CloseHandle(job)
             self.status_var.set(f"Failed to start: {e}")
             self.proc = None
             return
 
+        if job:
+            # Popen's process handle already has full access, so no OpenProcess is needed.
+            # subprocess does not expose the main thread handle; NtResumeProcess resumes it.
+            hProcess = int(self.proc._handle)
+            try:
+                if _kernel32.AssignProcessToJobObject(job, hProcess):
+                    # keep job handle alive on self so it closes when this process exits
+                    self._job = job
+                else:
+                    print("Failed to assign child to job object")
+                    _kernel32.CloseHandle(job)
+            finally:
+                try:
+                    status = _ntdll.NtResumeProcess(hProcess)
+                except Exception:
+                    status = -1
+            if status != 0:
+                # NtResumeProcess is undocumented; never leave a suspended child behind
+                print(f"NtResumeProcess failed (NTSTATUS 0x{status & 0xFFFFFFFF:08X})")
+                try:
+                    self.proc.kill()
+                    self.proc.wait(timeout=1)
+                except Exception:
+                    pass
+                self._clear_proc()
+                self.status_var.set("Failed to start: could not resume child process")
+                return
+
         self.status_var.set(f"Status: running (pid={self.proc.pid})")
         self.open_btn.config(state=tk.DISABLED)
         self.close_btn.config(state=tk.NORMAL)
-        self._start_polling()
+        self._watch_child()
 
     def close_black(self):
         if not self.proc:
             return
         try:
-            self.proc.terminate()
-            # wait briefly
-            for _ in range(10):
-                ret = self.proc.poll()
-                if ret is not None:
-                    break
-                time.sleep(0.1)
-            if self.proc.poll() is None:
-                self.proc.kill()
+            waited = False
+            if self._job:
+                # Kills the child and everything it spawned in one call
+                WAIT_TIMEOUT = 0x00000102
+                _kernel32.TerminateJobObject(self._job, 0)
+                waited = _kernel32.WaitForSingleObject(int(self.proc._handle), 1000) != WAIT_TIMEOUT
+            if not waited:
+                self.proc.terminate()
+                self.proc.wait(timeout=1)
+        except Exception:
+            pass
+        if self.proc.poll() is None:
+            # Keep tracking the child so it can still be closed from here
+            self.status_var.set(f"Status: failed to close (pid={self.proc.pid})")
+            return
+        self._clear_proc()
+
+    def _watch_child(self):
+        # Wait for the child on a background thread instead of polling from Tk.
+        # Calling event_generate from another thread needs a threaded Tcl build;
+        # fall back to polling when that is not available.
+        if not _tk_is_threaded(self.root):
+            self._start_polling()
+            return
+        threading.Thread(target=self._wait_child, args=(self.proc,), daemon=True).start()
+
+    def _wait_child(self, proc: subprocess.Popen):
+        try:
+            if sys.platform == 'win32':
+                INFINITE = 0xFFFFFFFF
+                _kernel32.WaitForSingleObject(int(proc._handle), INFINITE)
+            elif hasattr(os, 'pidfd_open'):
+                import selectors
+                fd = os.pidfd_open(proc.pid)
+                try:
+                    with selectors.DefaultSelector() as sel:
+                        sel.register(fd, selectors.EVENT_READ)
+                        sel.select()
+                finally:
+                    os.close(fd)
+            else:
+                proc.wait()
+        except Exception:
+            # pidfd_open fails if the child is already gone; just report it
+            pass
+        try:
+            self.root.event_generate("<<ChildExited>>", when="tail")
         except Exception:
+            # root was destroyed while we were waiting
             pass
-        finally:
+
+    def _on_child_exited(self, event=None):
+        if self.proc and self.proc.poll() is not None:
             self._clear_proc()
-        
-        if getattr(self, '_job', None):
+
+    def _clear_proc(self):
+        self.proc = None
+        if self._job:
+            # Closing the last handle kills anything the child left behind in the job
             try:
-                ctypes.windll.kernel32.CloseHandle(self._job)
+                _kernel32.CloseHandle(self._job)
             except Exception:
                 pass
             self._job = None
+        self.status_var.set("Status: closed")
+        self.open_btn.config(state=tk.NORMAL)
+        self.close_btn.config(state=tk.DISABLED)
 
     def _start_polling(self):
         if self._polling:
@@ -343,18 +485,23 @@ class ControllerApp:
             else:
                 # still running
                 self.status_var.set(f"Status: running (pid={self.proc.pid})")
+        else:
+            self._polling = False
+            return
         self.root.after(500, self._poll)
 
     def quit(self):
         self.close_black()
+        # The window icons stay in use until the window goes away, so they are freed here
+        # rather than when set_window_icon_for_tk runs
+        for hicon in _ICON_HANDLES:
+            _winicon.destroy(hicon)
+        _ICON_HANDLES.clear()
         self.root.quit()
 
 
 def main():
-    # If a child flag is present, run the fullscreen directly (this happens when the controller spawns itself)
-    if "--child" in sys.argv:
-        run_child_mode_from_args()
-        return
+    # Child mode (--child) is dispatched at the top of this module, before main() runs
     # Set an app id on Windows so the taskbar uses the exe icon
     set_app_user_model_id()
 
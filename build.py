@@ -5,19 +5,72 @@ Advanced packaging helper:
 - Converts `icon.png` -> `icon.ico` using `make_icon.py` if present
 - Cleans previous build artifacts (build/, dist/, .spec)
 - Runs PyInstaller with deterministic options
+- Skips all of the above when no input changed since the last build
+  (SHA-256 manifest in dist/.build-manifest.json, plus the Python and
+  PyInstaller versions)
 
 Usage:
-    python build.py
+    python build.py           # incremental
+    python build.py --force   # always rebuild (or set BUILD_FORCE=1)
 
 This is intended for CI and local reproducible builds.
 """
 from pathlib import Path
+import hashlib
+import json
+import os
 import subprocess
 import sys
 import shutil
 
 
 ROOT = Path(__file__).parent
+MANIFEST = ROOT / "dist" / ".build-manifest.json"
+EXE = ROOT / "dist" / ("black_controller.exe" if sys.platform == "win32" else "black_controller")
+
+
+def _sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _pyinstaller_version() -> str:
+    try:
+        import PyInstaller
+        return PyInstaller.__version__
+    except Exception:
+        return "missing"
+
+
+def input_hashes() -> dict:
+    files = sorted(ROOT.glob("*.py")) + [ROOT / "icon.png"]
+    if not (ROOT / "icon.png").exists():
+        # icon.ico is regenerated from icon.png when that exists; otherwise it is an input
+        files.append(ROOT / "icon.ico")
+    hashes = {p.name: _sha256(p) for p in files if p.exists()}
+    hashes["python"] = sys.version
+    hashes["pyinstaller"] = _pyinstaller_version()
+    return hashes
+
+
+def force_requested() -> bool:
+    return "--force" in sys.argv[1:] or os.environ.get("BUILD_FORCE", "") not in ("", "0")
+
+
+def is_up_to_date(hashes: dict) -> bool:
+    if not EXE.exists() or not MANIFEST.exists():
+        return False
+    try:
+        return json.loads(MANIFEST.read_text()) == hashes
+    except (OSError, ValueError):
+        return False
+
+
+def write_manifest(hashes: dict):
+    MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST.write_text(json.dumps(hashes, indent=2, sort_keys=True))
 
 
 def clean():
@@ -45,6 +98,12 @@ def run_pyinstaller():
     icon = ROOT / "icon.ico"
     # Build command so that --icon <icon.ico> appears before the script path
     cmd = [sys.executable, "-m", "PyInstaller", "--onefile", "--noconfirm", "--name", name, "--noconsole"]
+    # Smaller onefile payload -> less to extract on every launch: strip asserts and
+    # docstrings, skip UPX (decompression costs more than it saves), and drop stdlib
+    # packages that none of our modules import.
+    cmd += ["--optimize", "2", "--noupx"]
+    for mod in ("unittest", "pydoc", "email", "xml", "http"):
+        cmd += ["--exclude-module", mod]
     if icon.exists():
         cmd += ["--icon", str(icon)]
     cmd += [str(ROOT / "black_controller.py")]
@@ -53,9 +112,14 @@ def run_pyinstaller():
 
 
 def main():
+    hashes = input_hashes()
+    if not force_requested() and is_up_to_date(hashes):
+        print("up to date (use --force or BUILD_FORCE=1 to rebuild)")
+        return
     clean()
     make_icon_if_needed()
     run_pyinstaller()
+    write_manifest(hashes)
 
 
 if __name__ == "__main__":
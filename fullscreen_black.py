@@ -12,16 +12,15 @@ from __future__ import annotations
 import sys
 import ctypes
 from ctypes import wintypes
-import tkinter as tk
+from pathlib import Path
 
+import _winicon
 
-def get_monitors() -> list[dict]:
-    """Return a list of monitors with (left, top, right, bottom, width, height, primary).
-    Uses Win32 EnumDisplayMonitors / GetMonitorInfo.
-    """
-    user32 = ctypes.windll.user32
 
-    class RECT(ctypes.Structure):
+if sys.platform == 'win32':
+    from _winicon import user32 as _user32, shell32 as _shell32
+
+    class _RECT(ctypes.Structure):
         _fields_ = [
             ("left", wintypes.LONG),
             ("top", wintypes.LONG),
@@ -29,46 +28,64 @@ def get_monitors() -> list[dict]:
             ("bottom", wintypes.LONG),
         ]
 
-    class MONITORINFO(ctypes.Structure):
+    class _MONITORINFO(ctypes.Structure):
         _fields_ = [
             ("cbSize", wintypes.DWORD),
-            ("rcMonitor", RECT),
-            ("rcWork", RECT),
+            ("rcMonitor", _RECT),
+            ("rcWork", _RECT),
             ("dwFlags", wintypes.DWORD),
         ]
 
-    monitors: list[dict] = []
-
-    MonitorEnumProc = ctypes.WINFUNCTYPE(
-        wintypes.BOOL, ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(RECT), ctypes.c_void_p
+    _MONITOR_ENUM_PROC = ctypes.WINFUNCTYPE(
+        wintypes.BOOL, ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(_RECT), ctypes.c_void_p
     )
 
-    def _callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
-        mi = MONITORINFO()
-        mi.cbSize = ctypes.sizeof(MONITORINFO)
-        res = user32.GetMonitorInfoW(hMonitor, ctypes.byref(mi))
-        if not res:
-            return True
-        r = mi.rcMonitor
-        left, top, right, bottom = r.left, r.top, r.right, r.bottom
-        monitors.append({
-            "left": left,
-            "top": top,
-            "right": right,
-            "bottom": bottom,
-            "width": right - left,
-            "height": bottom - top,
-            "primary": bool(mi.dwFlags & 1),
-        })
+    # Monitor prototypes depend on the structures above, so they are declared here
+    _user32.GetMonitorInfoW.argtypes = [wintypes.HMONITOR, ctypes.POINTER(_MONITORINFO)]
+    _user32.GetMonitorInfoW.restype = wintypes.BOOL
+    _user32.EnumDisplayMonitors.argtypes = [wintypes.HDC, ctypes.POINTER(_RECT), _MONITOR_ENUM_PROC, wintypes.LPARAM]
+    _user32.EnumDisplayMonitors.restype = wintypes.BOOL
+
+# List the enum callback appends to while EnumDisplayMonitors runs
+_enum_results: list[dict] = []
+
+
+def _callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
+    mi = _MONITORINFO()
+    mi.cbSize = ctypes.sizeof(_MONITORINFO)
+    res = _user32.GetMonitorInfoW(hMonitor, ctypes.byref(mi))
+    if not res:
         return True
+    r = mi.rcMonitor
+    left, top, right, bottom = r.left, r.top, r.right, r.bottom
+    _enum_results.append({
+        "left": left,
+        "top": top,
+        "right": right,
+        "bottom": bottom,
+        "width": right - left,
+        "height": bottom - top,
+        "primary": bool(mi.dwFlags & 1),
+    })
+    return True
+
+
+if sys.platform == 'win32':
+    # Build the callback trampoline once and keep it alive for the life of the module
+    _ENUM_CB = _MONITOR_ENUM_PROC(_callback)
+
 
-    enum_proc = MonitorEnumProc(_callback)
-    if not user32.EnumDisplayMonitors(0, 0, enum_proc, 0):
+def get_monitors() -> list[dict]:
+    """Return a list of monitors with (left, top, right, bottom, width, height, primary).
+    Uses Win32 EnumDisplayMonitors / GetMonitorInfo.
+    """
+    _enum_results.clear()
+    if not _user32.EnumDisplayMonitors(None, None, _ENUM_CB, 0):
         # Fallback: try using GetSystemMetrics
-        w = user32.GetSystemMetrics(0)
-        h = user32.GetSystemMetrics(1)
-        monitors.append({"left": 0, "top": 0, "right": w, "bottom": h, "width": w, "height": h, "primary": True})
-    return monitors
+        w = _user32.GetSystemMetrics(0)
+        h = _user32.GetSystemMetrics(1)
+        _enum_results.append({"left": 0, "top": 0, "right": w, "bottom": h, "width": w, "height": h, "primary": True})
+    return list(_enum_results)
 
 
 def cover_monitor(monitor_index: int = 1):
@@ -92,45 +109,22 @@ def cover_monitor(monitor_index: int = 1):
     try:
         if sys.platform == 'win32':
             try:
-                from pathlib import Path as _P
                 if getattr(sys, 'frozen', False):
-                    exe_stem = _P(sys.executable).stem
+                    exe_stem = Path(sys.executable).stem
                     _appid = f"com.{exe_stem}"
                 else:
                     _appid = 'com.blackcontroller.dev'
-                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(_appid)
+                _shell32.SetCurrentProcessExplicitAppUserModelID(_appid)
             except Exception:
                 pass
     except Exception:
         pass
 
+    # Imported here so the ctypes setup above runs before Tk is loaded
+    import tkinter as tk
+
     root = tk.Tk()
-    try:
-        # Attempt to set the window icon explicitly so the taskbar uses it
-        if sys.platform == 'win32':
-            from ctypes import windll
-            ico = os.path.join(os.path.dirname(__file__), 'icon.ico')
-            if os.path.exists(ico):
-                LR_LOADFROMFILE = 0x00000010
-                IMAGE_ICON = 1
-                hicon = windll.user32.LoadImageW(None, ico, IMAGE_ICON, 0, 0, LR_LOADFROMFILE)
-                if hicon:
-                    WM_SETICON = 0x0080
-                    ICON_SMALL = 0
-                    ICON_BIG = 1
-                    windll.user32.SendMessageW(root.winfo_id(), WM_SETICON, ICON_SMALL, hicon)
-                    windll.user32.SendMessageW(root.winfo_id(), WM_SETICON, ICON_BIG, hicon)
-    except Exception:
-        pass
-    # set runtime icon if provided
-    try:
-        import os
-        ico = os.path.join(os.path.dirname(__file__), 'icon.ico')
-        if os.path.exists(ico):
-            root.iconbitmap(ico)
-    except Exception:
-        print("Failed to set window icon.")
-        pass
+    root._hicon = 0
     # Remove window decorations
     root.overrideredirect(True)
     # Make sure it appears on top
@@ -147,21 +141,44 @@ def cover_monitor(monitor_index: int = 1):
     canvas.pack()
     canvas.configure(background="#000000")
 
+    def close():
+        _winicon.destroy(root._hicon)
+        root._hicon = 0
+        root.destroy()
+
     # Grab keyboard to listen for ESC to exit
     def on_key(event):
         if event.keysym == "Escape":
-            root.destroy()
+            close()
 
     root.bind_all("<Key>", on_key)
+    root.protocol("WM_DELETE_WINDOW", close)
+
+    # Map the window so Tk creates its top-level wrapper; winfo_id() is only the
+    # inner child window, which ignores WM_SETICON and SetWindowPos
+    root.update_idletasks()
+    hwnd = 0
+    if sys.platform == 'win32':
+        try:
+            hwnd = _winicon.toplevel(root.winfo_id())
+        except Exception:
+            hwnd = root.winfo_id()
+
+    # Attempt to set the window icon explicitly so the taskbar uses it
+    if hwnd:
+        try:
+            ico = Path(__file__).with_name('icon.ico')
+            if ico.exists():
+                root._hicon = _winicon.apply(hwnd, ico)
+        except Exception:
+            print("Failed to set window icon.")
 
     # Ensure window covers taskbar and other top-level windows by using SetWindowPos
     try:
-        user32 = ctypes.windll.user32
         SWP_SHOWWINDOW = 0x0040
         HWND_TOPMOST = -1
-        hwnd = ctypes.windll.user32.GetParent(root.winfo_id()) or root.winfo_id()
         # Force position and size
-        user32.SetWindowPos(hwnd, HWND_TOPMOST, left, top, width, height, SWP_SHOWWINDOW)
+        _user32.SetWindowPos(hwnd, HWND_TOPMOST, left, top, width, height, SWP_SHOWWINDOW)
     except Exception:
         # If anything goes wrong with ctypes calls, continue — the tkinter window should still appear
         pass
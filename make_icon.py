@@ -17,8 +17,15 @@ def make_icon(src: Path, dst: Path):
     img = Image.open(src)
     # ICO should include multiple sizes; common sizes: 16,32,48,64,128,256
     sizes = [(16,16),(32,32),(48,48),(64,64),(128,128),(256,256)]
-    imgs = [img.resize(s, Image.LANCZOS) for s in sizes]
-    imgs[0].save(dst, format='ICO', sizes=sizes)
+    # Downsample in a cascade (256 -> 128 -> ... -> 16) so only the first step
+    # filters the full-size source; each later step works on the previous result.
+    imgs = []
+    cur = img
+    for s in sorted(sizes, reverse=True):
+        cur = cur.resize(s, Image.LANCZOS, reducing_gap=2.0)
+        imgs.append(cur)
+    # Save from the largest frame; the ICO writer only emits sizes <= the base image
+    imgs[0].save(dst, format='ICO', sizes=sizes, append_images=imgs[1:])
 
 
 def main():